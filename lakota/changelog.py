@@ -144,6 +144,8 @@ class Revision:
         self.child = child
         self.is_leaf = False
         self._payload = None
+        self._path = None
+        self._digests = None
 
     @classmethod
     def from_path(cls, changelog, path):
@@ -152,12 +154,16 @@ class Revision:
 
     @property
     def digests(self):
-        items = (self.parent, self.child)
-        return RevDigest(*(i.split("-")[1] for i in items))
+        if self._digests is None:
+            items = (self.parent, self.child)
+            self._digests = RevDigest(*(i.split("-")[1] for i in items))
+        return self._digests
 
     @property
     def path(self):
-        return f"{self.parent}.{self.child}"
+        if self._path is None:
+            self._path = f"{self.parent}.{self.child}"
+        return self._path
 
     @property
     def epoch(self):
@@ -183,14 +183,16 @@ class Commit:
         msgpck = registry.codec_registry["msgpack2"]()
         data = msgpck.decode(payload)[0]
         values = {}
-        # Decode starts, stops and digests
-        for key in ("start", "stop", "digest"):
-            key_vals = {}
-            columns = schema if key == "digest" else schema.idx
-            for name in columns:
-                codec = cls.digest_codec if key == "digest" else schema[name].codec
-                key_vals[name] = codec.decode(data[key][name])
-            values[key] = key_vals
+        # Decode starts and stops
+        for key in ("start", "stop"):
+            values[key] = {
+                name: col.codec.decode(data[key][name])
+                for name, col in schema.idx.items()
+            }
+        # Decode digests
+        values["digest"] = {
+            name: cls.digest_codec.decode(data["digest"][name]) for name in schema
+        }
 
         # Decode len and labels
         values["length"] = cls.len_codec.decode(data["length"])
@@ -204,21 +206,18 @@ class Commit:
     def encode(self):
         msgpck = registry.codec_registry["msgpack2"]()
         data = {}
-        # Encode starts, stops and digests
-        for key in ("start", "stop", "digest"):
-            columns = self.schema if key == "digest" else self.schema.idx
-            key_vals = {}
-            for pos, name in enumerate(columns):
-                codec = (
-                    self.digest_codec if key == "digest" else self.schema[name].codec
-                )
-                arr = getattr(self, key)[name]
-                key_vals[name] = codec.encode(arr)
-            data[key] = key_vals
+        # Encode starts and stops
+        for key in ("start", "stop"):
+            values = getattr(self, key)
+            data[key] = {
+                name: col.codec.encode(values[name])
+                for name, col in self.schema.idx.items()
+            }
 
         # Encode digests
-        for name in self.schema:
-            data["digest"][name] = self.digest_codec.encode(self.digest[name])
+        data["digest"] = {
+            name: self.digest_codec.encode(self.digest[name]) for name in self.schema
+        }
 
         # Encode length, closed and labels
         data["length"] = self.len_codec.encode(self.length)
@@ -273,8 +272,9 @@ class Commit:
         if embedded:
             self.embedded.update(embedded)
 
-        first = (self.at(0)["label"], self.at(0)["start"])
-        last = (self.at(-1)["label"], self.at(-1)["stop"])
+        first_row, last_row = self.at(0), self.at(-1)
+        first = (first_row["label"], first_row["start"])
+        last = (last_row["label"], last_row["stop"])
         if (label, start) < first and (label, stop) > last:
             return inner
 
@@ -39,11 +39,11 @@ class Frame:
     def from_segments(cls, schema, segments, limit=None, offset=None, select=None):
         if not segments:
             return Frame(schema)
-        select = select or schema.columns
+        names = schema.columns
+        if select:
+            names = [n for n in names if n in select]
         with Pool() as pool:
-            for name in schema.columns:
-                if name not in select:
-                    continue
+            for name in names:
                 pool.submit(
                     Frame.read_segments, segments, name, limit=limit, offset=offset
                 )
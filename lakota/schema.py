@@ -1,53 +1,83 @@
 import shlex
 from dataclasses import dataclass
 from datetime import date, datetime
+from functools import lru_cache
+from types import MappingProxyType
 
 from numcodecs import registry
 from numpy import asarray, ascontiguousarray, dtype, frombuffer, issubdtype, ndarray
 
-DTYPES = [dtype(s) for s in ("datetime64[s]", "int64", "float64", "U", "O")]
+ALIASES = MappingProxyType(
+    {
+        "date": "M8[D]",
+        "timestamp": "M8[s]",
+        "float": "f8",
+        "int": "i8",
+        "str": "U",
+    }
+)
 
-ALIASES = {
-    "date": "M8[D]",
-    "timestamp": "M8[s]",
-    "float": "f8",
-    "int": "i8",
-    "str": "U",
-}
+# Variable-length types, encoded with msgpack instead of blosc
+VLEN_DTYPES = (dtype("O"), dtype("U"))
 
 __all__ = ["Schema"]
 
-# Provide conversion between numpy and python types
+# Provide conversion between numpy and python types, each value is
+# the sequence of successive types to cast to
 DTYPE_MAP = {
     "default": {
-        dtype("M8[D]"): date,
-        dtype("M8[s]"): datetime,
-        dtype("float64"): float,
-        dtype("int64"): int,
+        dtype("M8[D]"): (date,),
+        dtype("M8[s]"): (datetime,),
+        dtype("float64"): (float,),
+        dtype("int64"): (int,),
     },
     "epoch": {
-        dtype("M8[D]"): ["M8[s]", int],
-        dtype("M8[s]"): int,
-        dtype("float64"): float,
-        dtype("int64"): int,
+        dtype("M8[D]"): ("M8[s]", int),
+        dtype("M8[s]"): (int,),
+        dtype("float64"): (float,),
+        dtype("int64"): (int,),
     },
 }
 
 
 class Codec:
     def __init__(self, dt, *codec_names):
-        # Make sure dtype is valid
-        dt = dtype(ALIASES.get(dt, dt))
+        # Make sure dtype is valid (aliases are case-insensitive, numpy
+        # type codes are not)
+        if isinstance(dt, str):
+            dt = ALIASES.get(dt.lower(), dt)
+        dt = dtype(dt)
         self.dt = dt
+        self.vlen = dt in VLEN_DTYPES
         # Build list of codecs
         if codec_names:
             self.codec_names = codec_names
         else:
             # Adapt dtypes and codec_names
             default_codec_names = ["blosc"]
-            if dt in (dtype("O"), dtype("U")):
+            if self.vlen:
                 default_codec_names = ["msgpack2", "zstd"]
             self.codec_names = default_codec_names
+        self._codecs = None
+
+    @property
+    def codecs(self):
+        # Instantiate codecs on first use only, many schemas (see
+        # `Schema.from_frame`) are created without ever encoding or
+        # decoding anything
+        if self._codecs is None:
+            codecs = []
+            for codec_name in self.codec_names:
+                codec = registry.codec_registry[codec_name]
+                kw = {}
+                if codec_name == "blosc":
+                    kw = {
+                        "cname": "zstd",
+                        "shuffle": codec.BITSHUFFLE,
+                    }
+                codecs.append(codec(**kw))
+            self._codecs = codecs
+        return self._codecs
 
     def encode(self, arr):
         if len(arr) == 0:
@@ -57,25 +87,17 @@ class Codec:
         # convert to proper type
         arr = arr.astype(self.dt)
         # Apply codecs
-        for codec_name in self.codec_names:
-            codec = registry.codec_registry[codec_name]
-            kw = {}
-            if codec_name == "blosc":
-                kw = {
-                    "cname": "zstd",
-                    "shuffle": codec.BITSHUFFLE,
-                }
-            arr = codec(**kw).encode(arr)
+        for codec in self.codecs:
+            arr = codec.encode(arr)
         return arr
 
     def decode(self, arr):
         if len(arr) == 0:
             return asarray([], dtype=self.dt)
         # Apply all codecs
-        for name in reversed(self.codec_names):
-            codec = registry.codec_registry[name]
-            arr = codec().decode(arr)
-        if self.dt in ("O", "U"):
+        for codec in reversed(self.codecs):
+            arr = codec.decode(arr)
+        if self.vlen:
             return arr.astype(self.dt)
         return frombuffer(arr, dtype=self.dt)
 
@@ -87,6 +109,31 @@ class Codec:
         return f"<Codec {self.dt}:{names}>"
 
 
+@lru_cache(maxsize=None)
+def _parse_definition(definition):
+    """
+    Parse a column definition (like `"timestamp*"` or `"str | zstd"`)
+    and return a `(dt, codec_names, idx)` tuple. Definitions are
+    drawn from a small set of literals so results are cached.
+    """
+    parser = shlex.shlex(definition, posix=True, punctuation_chars="|*")
+    parser.wordchars += "[]"
+    dt, *tokens = parser
+    idx = False
+    codec_names = []
+    state = None
+    for tk in tokens:
+        if tk == "|":
+            state = "codec"
+        elif tk == "*":
+            idx = True
+        elif state == "codec":
+            codec_names.append(tk)
+        else:
+            raise ValueError(f"Unexpected item: {tk}")
+    return dt, tuple(codec_names), idx
+
+
 class SchemaColumn:
     def __init__(self, name, dt, codecs, idx):
         self.name = name
@@ -95,21 +142,7 @@ class SchemaColumn:
 
     @classmethod
     def from_ui(cls, name, definition):
-        parser = shlex.shlex(definition, posix=True, punctuation_chars="|*")
-        parser.wordchars += "[]"
-        dt, *tokens = parser
-        idx = False
-        codec_names = []
-        state = None
-        for tk in tokens:
-            if tk == "|":
-                state = "codec"
-            elif tk == "*":
-                idx = True
-            elif state == "codec":
-                codec_names.append(tk)
-            else:
-                raise ValueError(f"Unexpected item: {tk}")
+        dt, codec_names, idx = _parse_definition(definition)
         return SchemaColumn(name, dt, codecs=codec_names, idx=idx)
 
     def cast(self, arr):
@@ -122,17 +155,13 @@ class SchemaColumn:
         Return `arr` (based on numpy types) converted to python
         type. `style` can be default or `epoch`.
         """
-        mapping = DTYPE_MAP[style]
-        dts = mapping.get(self.codec.dt)
-        if dts is None:
-            return arr
-        dts = dts if isinstance(dts, (list, tuple)) else [dts]
+        dts = DTYPE_MAP[style].get(self.codec.dt, ())
         for dt in dts:
             arr = arr.astype(dt)
         return arr
 
     def cast_scalar(self, value):
-        return dtype(self.codec.dt).type(value)
+        return self.codec.dt.type(value)
 
     def dumps(self):
         return {
@@ -241,6 +270,10 @@ class Schema:
     def __getitem__(self, name):
         return self.columns[name]
 
+    def __contains__(self, name):
+        # Without it, `in` falls back on a linear scan of __iter__
+        return name in self.columns
+
     def row(self, df, pos, full=True):
         """
         Extract a row of the dataframe-like object at
@@ -1,4 +1,4 @@
-from numpy import ascontiguousarray, dtype, issubdtype
+from numpy import ascontiguousarray, issubdtype
 
 from .batch import Batch
 from .changelog import phi
@@ -97,30 +97,29 @@ class Series:
         all_dig = []
         arr_length = None
         embedded = {}
+        embed_max_size = settings.embed_max_size
         with Pool() as pool:
-            for name in self.schema:
+            for name, col in self.schema.columns.items():
                 # Cast array & check len
-                arr = self.schema[name].cast(frame[name])
+                arr = col.cast(frame[name])
                 if arr_length is None:
                     arr_length = len(arr)
                 elif len(arr) != arr_length:
                     raise ValueError("Length mismatch")
                 # Encode content
-                data = self.schema[name].codec.encode(arr)
+                codec = col.codec
+                data = codec.encode(arr)
                 # Create digest (based on actual array for simple
                 # type, based on encoded content for O and U)
-                codec = self.schema[name].codec
                 if issubdtype(codec.dt, "M"):
                     digest = hexdigest(ascontiguousarray(arr.view("i8")))
-                elif codec.dt in (dtype("O"), dtype("U")):
+                elif codec.vlen:
                     digest = hexdigest(data)
                 else:
                     digest = hexdigest(ascontiguousarray(arr))
                 all_dig.append(digest)
 
-                if (
-                    len(data) < settings.embed_max_size
-                ):  # every small array gets embedded
+                if len(data) < embed_max_size:  # every small array gets embedded
                     # Put small arrays aside
                     embedded[digest] = data
                     continue
@@ -319,8 +318,7 @@ class KVSeries(Series):
         # Concat both frame and reduce it
         new_frm = Frame.concat(frame, db_frm)
         reduce_kw = {c: c for c in self.schema.idx}
-        non_idx = [c for c in self.schema if c not in self.schema.idx]
-        reduce_kw.update({c: f"(first self.{c})" for c in non_idx})
+        reduce_kw.update({c: f"(first self.{c})" for c in self.schema.non_idx})
         new_frm = new_frm.reduce(**reduce_kw)
         return super().write(new_frm)  # XXX pass closed ?
 
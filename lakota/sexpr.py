@@ -47,7 +47,7 @@ max_new_cases-> [22210]
 
 import operator
 import shlex
-from functools import reduce
+from functools import lru_cache, reduce
 
 import numpy
 from numpy import bincount, inf, max, maximum, mean, min, minimum, quantile, repeat, sum
@@ -229,19 +229,44 @@ def tokenize(expr):
 
 
 def scan(tokens, end_tk=")"):
-    res = []
+    # Keep parent lists on an explicit stack instead of recursing on
+    # each opening parenthesis, so parsing depth is not bounded by the
+    # interpreter recursion limit. `close` is the token that ends the
+    # current list, so each token is compared only once against it.
+    stack = []
+    cur = []
+    close = end_tk
     for tk in tokens:
-        if tk.value == end_tk:
-            return res
+        if tk.value == close:
+            if not stack:
+                return cur
+            parent = stack.pop()
+            parent.append(cur)
+            cur = parent
+            if not stack:
+                close = end_tk
         elif tk.value == "(":
-            res.append(scan(tokens))
+            stack.append(cur)
+            cur = []
+            close = ")"
         else:
-            res.append(tk)
+            cur.append(tk)
+
+    # Close un-terminated lists
+    while stack:
+        parent = stack.pop()
+        parent.append(cur)
+        cur = parent
+    return cur
+
 
-    tail = next(tokens, None)
-    if tail:
-        raise ValueError(f'Unexpected token: "{tail.value}"')
-    return res
+@lru_cache(maxsize=4096)
+def parse_tokens(expr):
+    # The same expressions are parsed again and again (on each
+    # `Frame.reduce` or `Frame.mask` call), the resulting tree is
+    # never mutated so it can be shared
+    res = tokenize(expr)
+    return scan(res)[0]
 
 
 class AST:
@@ -287,12 +312,12 @@ class AST:
 
     @classmethod
     def parse(cls, expr):
-        res = tokenize(expr)
-        tokens = scan(res)[0]
-        return AST(tokens)
+        return AST(parse_tokens(expr))
 
     def eval(self, env=None):
-        env = Env(env or {})
+        # Nested evaluations share the Env of their parent
+        if not isinstance(env, Env):
+            env = Env(env or {})
         if isinstance(self.tokens, Token):
             return self.tokens.eval(env)
         head, tail = self.tokens[0], self.tokens[1:]
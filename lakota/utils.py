@@ -141,17 +141,24 @@ def timeit(title=""):
 
 
 def memoize(fn):
-    fn = fn
+    """
+    Cache results of `fn` based on its arguments. The cache is
+    attached to the returned wrapper (and can be emptied with
+    `cache_clear`), so avoid using it on methods: `self` would be
+    part of the key and kept alive for the life of the wrapper.
+    """
     cache = {}
 
     def wrapper(*a, **kw):
-        key = a + tuple(kw.keys()) + tuple(kw.values())
+        key = (a, tuple(sorted(kw.items())))
         if key in cache:
             return cache[key]
         res = fn(*a, **kw)
         cache[key] = res
         return res
 
+    wrapper.cache = cache
+    wrapper.cache_clear = cache.clear
     return wrapper
 
 
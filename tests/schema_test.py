@@ -68,3 +68,26 @@ def test_serialize():
 def test_equality():
     definition = {"timestamp": "timestamp*", "float": "f8", "int": "i8", "str": "str"}
     assert Schema(**definition) == Schema(**definition)
+
+
+def test_contains():
+    schema = Schema(timestamp="timestamp*", value="float")
+    assert "timestamp" in schema
+    assert "value" in schema
+    assert "other" not in schema
+
+
+def test_column_definition():
+    schema = Schema(timestamp="timestamp*", value="float | blosc")
+    assert schema["timestamp"].idx
+    assert schema["timestamp"].codec.dt == "M8[s]"
+    assert not schema["value"].idx
+    assert schema["value"].codec.codec_names == ("blosc",)
+
+    with pytest.raises(ValueError):
+        Schema(timestamp="timestamp* blosc")
+
+    # Aliases are case-insensitive
+    schema = Schema(timestamp="Timestamp*", value="FLOAT")
+    assert schema["timestamp"].codec.dt == "M8[s]"
+    assert schema["value"].codec.dt == "f8"
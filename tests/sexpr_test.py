@@ -1,8 +1,10 @@
+import sys
+
 import pytest
 from numpy import asarray
 
 from lakota import Frame, Schema
-from lakota.sexpr import AST, KWargs
+from lakota.sexpr import AST, KWargs, scan, tokenize
 from lakota.utils import floor
 
 trueish_expr = [
@@ -29,6 +31,28 @@ def test_trueish_expr():
         assert res is True
 
 
+def test_deeply_nested_scan():
+    # Deeper than what a recursive implementation can handle
+    depth = sys.getrecursionlimit() + 100
+    tree = scan(tokenize("(" * depth + "x" + ")" * depth))
+    for _ in range(depth):
+        (tree,) = tree
+    (tk,) = tree
+    assert tk.value == "x"
+
+
+def test_parse_cache():
+    expr = "(+ (* x 2) y)"
+    first = AST.parse(expr)
+    second = AST.parse(expr)
+    # Token trees are shared between parses of the same expression
+    assert first.tokens is second.tokens
+    # So evaluation must not alter them
+    assert first.eval({"x": 1, "y": 2}) == 4
+    assert second.eval({"x": 10, "y": 20}) == 40
+    assert AST.parse(expr).eval({"x": 1, "y": 2}) == 4
+
+
 def test_kw():
     res = AST.parse("(kw 'return_counts' true)").eval()
     assert isinstance(res, KWargs)
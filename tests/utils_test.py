@@ -3,7 +3,7 @@ from itertools import chain
 
 import pytest
 
-from lakota.utils import Closed, Pool, chunky, drange, strpt
+from lakota.utils import Closed, Pool, chunky, drange, memoize, strpt
 
 
 def my_fun(i, flaky=False):
@@ -27,6 +27,22 @@ def test_pool(threaded):
                 pool.submit(my_fun, i, flaky=True)
 
 
+def test_memoize():
+    calls = []
+
+    @memoize
+    def fn(*a, **kw):
+        calls.append((a, kw))
+        return len(calls)
+
+    assert fn(1, x=2) == fn(1, x=2) == 1
+    # Positional and keyword arguments must not collide
+    assert fn(1, "x", 2) == 2
+    assert len(fn.cache) == 2
+    fn.cache_clear()
+    assert fn(1, x=2) == 3
+
+
 def test_chunk():
     for size in (1, 4, 13, 100):
         expected = list(range(size))